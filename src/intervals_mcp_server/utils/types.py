@@ -1,8 +1,28 @@
-from dataclasses import dataclass
-from typing import List, Dict, Optional, Any, Union
+from dataclasses import dataclass, fields, is_dataclass
+from functools import cache
+from typing import (
+    List,
+    Dict,
+    Optional,
+    Any,
+    Callable,
+    Iterable,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 from enum import Enum
 import json
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # orjson is installed with the "orjson" extra
+    _HAS_ORJSON = False
+
 
 __all__ = [
     "Option",
@@ -70,12 +90,106 @@ class ValueUnits(Enum):
     CADENCE = "cadence"
 
 
+# Display templates for a value and the label shown after it, keyed by unit
+_VALUE_TEMPLATES: Dict[Optional[ValueUnits], str] = {
+    ValueUnits.PERCENT_HR: "{}%",
+    ValueUnits.PERCENT_MMP: "{}%",
+    ValueUnits.PERCENT_LTHR: "{}%",
+    ValueUnits.PERCENT_PACE: "{}%",
+    ValueUnits.PERCENT_FTP: "{}%",
+    ValueUnits.POWER_ZONE: "Z{}",
+    ValueUnits.HR_ZONE: "Z{}",
+    ValueUnits.PACE_ZONE: "Z{}",
+    ValueUnits.WATTS: "{}W",
+    ValueUnits.CADENCE: "{}rpm",
+}
+
+_UNIT_LABELS: Dict[Optional[ValueUnits], str] = {
+    ValueUnits.PERCENT_HR: "HR",
+    ValueUnits.HR_ZONE: "HR",
+    ValueUnits.PERCENT_MMP: "MMP",
+    ValueUnits.PERCENT_LTHR: "LTHR",
+    ValueUnits.PERCENT_PACE: "Pace",
+    ValueUnits.PACE_ZONE: "Pace",
+    ValueUnits.PERCENT_FTP: "ftp",
+    ValueUnits.POWER_ZONE: "W",
+    ValueUnits.CADENCE: "Cadence",
+}
+
+
+def _orjson_dumps(data: Any) -> str:
+    """Encode data as a JSON string with orjson."""
+    return orjson.dumps(data).decode()
+
+
+# Like orjson, the stdlib fallback writes compact JSON and keeps non-ASCII text as-is
+_stdlib_json_dumps: Callable[[Any], str] = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":")
+).encode
+
+# The JSON backend is picked once at import time so to_json/from_json make a single direct call
+_json_dumps: Callable[[Any], str] = _orjson_dumps if _HAS_ORJSON else _stdlib_json_dumps
+_json_loads: Callable[[Union[str, bytes]], Any] = orjson.loads if _HAS_ORJSON else json.loads
+
+
+def _enum_decoder(enum_cls: type[Enum]) -> Callable[[Any], Enum]:
+    """Build a converter that resolves raw values through the enum's value-to-member map."""
+    members = enum_cls._value2member_map_
+
+    def decode(value: Any) -> Enum:
+        try:
+            member = members.get(value)
+        except TypeError:  # unhashable input; let the constructor raise its usual ValueError
+            member = None
+        # Fall back to the constructor for members passed in directly and for invalid values
+        return member if member is not None else enum_cls(value)
+
+    return decode
+
+
+def _field_decoder(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """Return a converter for values of the given field annotation, or None for plain JSON values."""
+    origin = get_origin(annotation)
+    if origin is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _field_decoder(args[0]) if len(args) == 1 else None
+    if origin is list:
+        decode_item = _field_decoder(get_args(annotation)[0])
+        if decode_item is None:
+            return None
+        return lambda items: [decode_item(item) for item in items]
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return _enum_decoder(annotation)
+    if isinstance(annotation, type) and is_dataclass(annotation):
+        return lambda data: _dataclass_from_dict(annotation, data)
+    return None
+
+
+@cache
+def _field_decoders(cls: type) -> Dict[str, Optional[Callable[[Any], Any]]]:
+    """Map each field of a dataclass to the converter used when reading it from a dictionary."""
+    hints = get_type_hints(cls)
+    return {f.name: _field_decoder(hints[f.name]) for f in fields(cls)}
+
+
+def _dataclass_from_dict(cls: Any, data: Dict[str, Any]) -> Any:
+    """Create a dataclass instance from a dictionary, ignoring unknown keys."""
+    decoders = _field_decoders(cls)
+    kwargs: Dict[str, Any] = {}
+    # Walk the keys that are present rather than every declared field; workout dicts are sparse
+    for name, value in data.items():
+        if name in decoders:
+            decode = decoders[name]
+            kwargs[name] = value if decode is None or value is None else decode(value)
+    return cls(**kwargs)
+
+
 def float_to_str(value: float) -> str:
     """Format the value without decimals if it's a whole number."""
     return str(int(value)) if value.is_integer() else str(value)
 
 
-@dataclass
+@dataclass(slots=True)
 class Value:
     value: Optional[float] = None
     start: Optional[float] = None
@@ -101,76 +215,38 @@ class Value:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Value":
         """Create Value instance from dictionary."""
-        kwargs: Dict[str, Any] = {}
-        if "value" in data:
-            kwargs["value"] = data["value"]
-        if "start" in data:
-            kwargs["start"] = data["start"]
-        if "end" in data:
-            kwargs["end"] = data["end"]
-        if "units" in data:
-            kwargs["units"] = ValueUnits(data["units"])
-        if "target" in data:
-            kwargs["target"] = HrTarget(data["target"])
-        return cls(**kwargs)
+        return _dataclass_from_dict(cls, data)
 
     def to_json(self) -> str:
         """Convert Value instance to JSON string."""
-        return json.dumps(self.to_dict())
+        return _json_dumps(self.to_dict())
 
     @classmethod
-    def from_json(cls, json_str: str) -> "Value":
+    def from_json(cls, json_str: Union[str, bytes]) -> "Value":
         """Create Value instance from JSON string."""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(_json_loads(json_str))
 
     def _format_value(self, value: float) -> str:
-        if self.units in [
-            ValueUnits.PERCENT_HR,
-            ValueUnits.PERCENT_MMP,
-            ValueUnits.PERCENT_LTHR,
-            ValueUnits.PERCENT_PACE,
-            ValueUnits.PERCENT_FTP,
-        ]:
-            return f"{float_to_str(value)}%"
-        elif self.units in [ValueUnits.POWER_ZONE, ValueUnits.HR_ZONE, ValueUnits.PACE_ZONE]:
-            return f"Z{float_to_str(value)}"
-        elif self.units in [ValueUnits.WATTS]:
-            return f"{float_to_str(value)}W"
-        elif self.units in [ValueUnits.CADENCE]:
-            return f"{float_to_str(value)}rpm"
-        return float_to_str(value)
+        template = _VALUE_TEMPLATES.get(self.units)
+        return template.format(float_to_str(value)) if template else float_to_str(value)
 
     def _format_units(self) -> str:
-        if self.units in [ValueUnits.PERCENT_HR, ValueUnits.HR_ZONE]:
-            return "HR"
-        elif self.units in [ValueUnits.PERCENT_MMP]:
-            return "MMP"
-        elif self.units in [ValueUnits.PERCENT_LTHR]:
-            return "LTHR"
-        elif self.units in [ValueUnits.PERCENT_PACE, ValueUnits.PACE_ZONE]:
-            return "Pace"
-        elif self.units in [ValueUnits.PERCENT_FTP]:
-            return "ftp"
-        elif self.units in [ValueUnits.POWER_ZONE]:
-            return "W"
-        elif self.units in [ValueUnits.CADENCE]:
-            return "Cadence"
-        return ""
+        return _UNIT_LABELS.get(self.units, "")
 
     def __str__(self) -> str:
-        val = ""
+        parts: List[str] = []
         if self.start is not None and self.end is not None:
-            val += f"{self.start} - {self.end} "
+            parts.append(f"{self.start} - {self.end} ")
         if self.value is not None:
-            val += f"{self._format_value(self.value)} "
+            parts.append(f"{self._format_value(self.value)} ")
         if self.units is not None:
-            val += f"{self._format_units()} "
+            parts.append(f"{self._format_units()} ")
         if self.target is not None:
-            val += f"hr={self.target.value} "
-        return val.strip()
+            parts.append(f"hr={self.target.value} ")
+        return "".join(parts).strip()
 
 
-@dataclass
+@dataclass(slots=True)
 class Step:
     text: Optional[str] = None
     text_locale: Optional[Dict[str, str]] = None
@@ -248,77 +324,32 @@ class Step:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Step":
         """Create Step instance from dictionary."""
-        kwargs: Dict[str, Any] = {}
-        if "text" in data:
-            kwargs["text"] = data["text"]
-        if "text_locale" in data:
-            kwargs["text_locale"] = data["text_locale"]
-        if "duration" in data:
-            kwargs["duration"] = data["duration"]
-        if "distance" in data:
-            kwargs["distance"] = data["distance"]
-        if "until_lap_press" in data:
-            kwargs["until_lap_press"] = data["until_lap_press"]
-        if "reps" in data:
-            kwargs["reps"] = data["reps"]
-        if "warmup" in data:
-            kwargs["warmup"] = data["warmup"]
-        if "cooldown" in data:
-            kwargs["cooldown"] = data["cooldown"]
-        if "intensity" in data:
-            kwargs["intensity"] = Intensity(data["intensity"])
-        if "steps" in data:
-            kwargs["steps"] = [cls.from_dict(step) for step in data["steps"]]
-        if "ramp" in data:
-            kwargs["ramp"] = data["ramp"]
-        if "freeride" in data:
-            kwargs["freeride"] = data["freeride"]
-        if "maxeffort" in data:
-            kwargs["maxeffort"] = data["maxeffort"]
-        if "power" in data:
-            kwargs["power"] = Value.from_dict(data["power"])
-        if "hr" in data:
-            kwargs["hr"] = Value.from_dict(data["hr"])
-        if "pace" in data:
-            kwargs["pace"] = Value.from_dict(data["pace"])
-        if "cadence" in data:
-            kwargs["cadence"] = Value.from_dict(data["cadence"])
-        if "hidepower" in data:
-            kwargs["hidepower"] = data["hidepower"]
-        if "_power" in data:
-            kwargs["_power"] = Value.from_dict(data["_power"])
-        if "_hr" in data:
-            kwargs["_hr"] = Value.from_dict(data["_hr"])
-        if "_pace" in data:
-            kwargs["_pace"] = Value.from_dict(data["_pace"])
-        if "_distance" in data:
-            kwargs["_distance"] = data["_distance"]
-        return cls(**kwargs)
+        return _dataclass_from_dict(cls, data)
 
     def to_json(self) -> str:
         """Convert Step instance to JSON string."""
-        return json.dumps(self.to_dict())
+        return _json_dumps(self.to_dict())
 
     @classmethod
-    def from_json(cls, json_str: str) -> "Step":
+    def from_json(cls, json_str: Union[str, bytes]) -> "Step":
         """Create Step instance from JSON string."""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(_json_loads(json_str))
 
     def _format_duration(self) -> str:
         """Format duration into a human-readable string."""
         if self.duration is None:
             return ""
-        remaining_duration = self.duration
-        val = ""
-        if remaining_duration > 3600:
-            val += f"{remaining_duration // 3600}h"
-            remaining_duration %= 3600
-        if remaining_duration > 100 or remaining_duration == 60:
-            val += f"{remaining_duration // 60}m"
-            remaining_duration %= 60
-        if remaining_duration > 0:
-            val += f"{remaining_duration}s"
-        return val
+        hours, remainder = divmod(self.duration, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        parts: List[str] = []
+        if hours:
+            parts.append(f"{hours}h")
+        # keep the minutes between hours and seconds so "1h0m30s" is not read as 1h30s
+        if minutes or (hours and seconds):
+            parts.append(f"{minutes}m")
+        if seconds:
+            parts.append(f"{seconds}s")
+        return "".join(parts) or "0s"
 
     def _format_distance(self) -> str:
         """Format distance into a human-readable string."""
@@ -329,58 +360,73 @@ class Step:
         return f"{float_to_str(self.distance / 1000)}km"
 
     def to_string(self, nested: bool = False) -> str:
-        val = ""
+        parts: List[str] = []
+        self._render(parts, nested)
+        return "".join(parts)
+
+    def _render(self, parts: List[str], nested: bool = False) -> None:
+        """Append the rendering of this step and its nested steps to parts."""
+        # steps still to render, or separators to emit once the steps pushed before them are done
+        pending: List[Union[str, Tuple["Step", bool]]] = [(self, nested)]
+        while pending:
+            item = pending.pop()
+            if isinstance(item, str):
+                parts.append(item)
+                continue
+            step, step_nested = item
+            step._append_summary(parts, step_nested)
+            if step.reps is not None and step.steps is not None:
+                pending.append("\n")
+                for child in reversed(step.steps):
+                    pending.append((child, True))
+                    pending.append("\n")
+            elif not step_nested and (step.warmup or step.cooldown):
+                parts.append("\n")
+
+    def _append_summary(self, parts: List[str], nested: bool) -> None:
+        """Append the line describing this step, without its nested steps, to parts."""
         if self.reps is not None:
             if nested:
                 raise ValueError("Nested steps not supported")
-            val += f"\n{self.reps}x "
+            parts.append(f"\n{self.reps}x ")
         else:
             if not nested and self.warmup:
-                val += "\nWarmup\n"
+                parts.append("\nWarmup\n")
             if not nested and self.cooldown:
-                val += "\nCooldown\n"
+                parts.append("\nCooldown\n")
 
-            val += ""
             if self.duration is not None:
-                val += f"- {self._format_duration()} "
+                parts.append(f"- {self._format_duration()} ")
             elif self.distance is not None:
-                val += f"- {self._format_distance()} "
+                parts.append(f"- {self._format_distance()} ")
 
             if self.freeride:
-                val += "freeride "
+                parts.append("freeride ")
             if self.maxeffort:
-                val += "maxeffort "
+                parts.append("maxeffort ")
             if self.ramp:
-                val += "ramp "
+                parts.append("ramp ")
             if self.hidepower:
-                val += "hidepower "
+                parts.append("hidepower ")
             if self.intensity is not None:
-                val += f"intensity={self.intensity.value} "
+                parts.append(f"intensity={self.intensity.value} ")
 
             if self.power is not None:
-                val += f"{self.power} "
+                parts.append(f"{self.power} ")
             if self.hr is not None:
-                val += f"{self.hr} "
+                parts.append(f"{self.hr} ")
             if self.pace is not None:
-                val += f"{self.pace} "
+                parts.append(f"{self.pace} ")
             if self.cadence is not None:
-                val += f"{self.cadence} "
+                parts.append(f"{self.cadence} ")
         if self.text is not None:
-            val += f"{self.text} "
-
-        if self.reps is not None and self.steps is not None:
-            for step in self.steps:
-                val += "\n" + step.to_string(nested=True)
-            val += "\n"
-        elif not nested and (self.warmup or self.cooldown):
-            val += "\n"
-        return val
+            parts.append(f"{self.text} ")
 
     def __str__(self) -> str:  # pragma: no cover - simple wrapper
         return self.to_string(False)
 
 
-@dataclass
+@dataclass(slots=True)
 class SportSettings:
     # Add fields as needed based on the actual SportSettings class
     pass
@@ -392,19 +438,19 @@ class SportSettings:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SportSettings":
         """Create SportSettings instance from dictionary."""
-        return cls()
+        return _dataclass_from_dict(cls, data)
 
     def to_json(self) -> str:
         """Convert SportSettings instance to JSON string."""
-        return json.dumps(self.to_dict())
+        return _json_dumps(self.to_dict())
 
     @classmethod
-    def from_json(cls, json_str: str) -> "SportSettings":
+    def from_json(cls, json_str: Union[str, bytes]) -> "SportSettings":
         """Create SportSettings instance from JSON string."""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(_json_loads(json_str))
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkoutDoc:
     description: Optional[str] = None
     description_locale: Optional[Dict[str, str]] = None
@@ -462,53 +508,33 @@ class WorkoutDoc:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "WorkoutDoc":
         """Create WorkoutDoc instance from dictionary."""
-        kwargs: Dict[str, Any] = {}
-        if "description" in data:
-            kwargs["description"] = data["description"]
-        if "description_locale" in data:
-            kwargs["description_locale"] = data["description_locale"]
-        if "duration" in data:
-            kwargs["duration"] = data["duration"]
-        if "distance" in data:
-            kwargs["distance"] = data["distance"]
-        if "ftp" in data:
-            kwargs["ftp"] = data["ftp"]
-        if "lthr" in data:
-            kwargs["lthr"] = data["lthr"]
-        if "threshold_pace" in data:
-            kwargs["threshold_pace"] = data["threshold_pace"]
-        if "pace_units" in data:
-            kwargs["pace_units"] = PaceUnits(data["pace_units"])
-        if "sportSettings" in data:
-            kwargs["sportSettings"] = SportSettings.from_dict(data["sportSettings"])
-        if "category" in data:
-            kwargs["category"] = data["category"]
-        if "target" in data:
-            kwargs["target"] = WorkoutTarget(data["target"])
-        if "steps" in data:
-            kwargs["steps"] = [Step.from_dict(step) for step in data["steps"]]
-        if "zoneTimes" in data:
-            kwargs["zoneTimes"] = data["zoneTimes"]
-        if "options" in data:
-            kwargs["options"] = data["options"]
-        if "locales" in data:
-            kwargs["locales"] = data["locales"]
-        return cls(**kwargs)
+        return _dataclass_from_dict(cls, data)
 
     def to_json(self) -> str:
         """Convert WorkoutDoc instance to JSON string."""
-        return json.dumps(self.to_dict())
+        return _json_dumps(self.to_dict())
 
     @classmethod
-    def from_json(cls, json_str: str) -> "WorkoutDoc":
+    def from_json(cls, json_str: Union[str, bytes]) -> "WorkoutDoc":
         """Create WorkoutDoc instance from JSON string."""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(_json_loads(json_str))
+
+    @staticmethod
+    def dump_many(docs: Iterable["WorkoutDoc"]) -> str:
+        """Convert several WorkoutDoc instances to a single JSON array string."""
+        return _json_dumps([doc.to_dict() for doc in docs])
+
+    @classmethod
+    def load_many(cls, json_str: Union[str, bytes]) -> List["WorkoutDoc"]:
+        """Create WorkoutDoc instances from a JSON array string."""
+        return [cls.from_dict(data) for data in _json_loads(json_str)]
 
     def __str__(self) -> str:
-        val = ""
+        parts: List[str] = []
         if self.description is not None:
-            val += f"{self.description}\n"
+            parts.append(f"{self.description}\n")
         if self.steps is not None:
             for step in self.steps:
-                val += step.to_string() + "\n"
-        return val
+                step._render(parts)
+                parts.append("\n")
+        return "".join(parts)
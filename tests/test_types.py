@@ -0,0 +1,238 @@
+"""
+Unit tests for the workout types in intervals_mcp_server.utils.types.
+
+These tests verify that workout documents serialize to and from dictionaries and JSON without
+losing information, and that None fields are omitted from the serialized output.
+"""
+
+import json
+from dataclasses import fields
+import pytest
+from intervals_mcp_server.utils import types
+from intervals_mcp_server.utils.types import (
+    HrTarget,
+    Intensity,
+    Step,
+    Value,
+    ValueUnits,
+    WorkoutDoc,
+    float_to_str,
+)
+
+WORKOUT_DATA = {
+    "description": "Threshold intervals",
+    "duration": 3600,
+    "target": "POWER",
+    "steps": [
+        {
+            "warmup": True,
+            "duration": 600,
+            "intensity": "warmup",
+            "power": {"start": 50.0, "end": 75.0, "units": "%ftp"},
+        },
+        {
+            "reps": 3,
+            "steps": [
+                {"duration": 480, "power": {"value": 100.0, "units": "%ftp"}},
+                {"duration": 120, "hr": {"value": 2.0, "units": "hr_zone", "target": "10s"}},
+            ],
+        },
+        {"cooldown": True, "duration": 300, "_power": {"value": 120.0, "units": "w"}},
+    ],
+}
+
+
+@pytest.fixture(params=["json", "orjson"])
+def json_backend(request, monkeypatch):
+    """
+    Run the test once with the stdlib JSON backend and once with orjson.
+    """
+    if request.param == "orjson":
+        orjson = pytest.importorskip("orjson")
+        monkeypatch.setattr(types, "_json_dumps", types._orjson_dumps)
+        monkeypatch.setattr(types, "_json_loads", orjson.loads)
+    else:
+        monkeypatch.setattr(types, "_json_dumps", types._stdlib_json_dumps)
+        monkeypatch.setattr(types, "_json_loads", json.loads)
+    return request.param
+
+
+def test_value_to_dict_omits_none_and_uses_enum_values():
+    """
+    Test that Value.to_dict drops unset fields and serializes enums by value.
+    """
+    value = Value(value=2.0, units=ValueUnits.HR_ZONE, target=HrTarget.TEN_SECOND)
+    assert value.to_dict() == {"value": 2.0, "units": "hr_zone", "target": "10s"}
+
+
+def test_step_to_dict_nested():
+    """
+    Test that Step.to_dict serializes nested steps, values and underscore-prefixed fields.
+    """
+    step = Step(
+        reps=2,
+        intensity=Intensity.INTERVAL,
+        steps=[Step(duration=60, _power=Value(value=300.0, units=ValueUnits.WATTS))],
+    )
+    assert step.to_dict() == {
+        "reps": 2,
+        "intensity": "interval",
+        "steps": [{"duration": 60, "_power": {"value": 300.0, "units": "w"}}],
+    }
+
+
+def test_step_to_dict_covers_every_field():
+    """
+    Test that Step.to_dict emits every field of a fully populated step.
+    """
+    value = Value(value=1.0)
+    step = Step(
+        text="x",
+        text_locale={"en": "x"},
+        duration=60,
+        distance=100.0,
+        until_lap_press=True,
+        reps=2,
+        warmup=True,
+        cooldown=False,
+        intensity=Intensity.ACTIVE,
+        steps=[Step(duration=30)],
+        ramp=True,
+        freeride=False,
+        maxeffort=False,
+        power=value,
+        hr=value,
+        pace=value,
+        cadence=value,
+        hidepower=False,
+        _power=value,
+        _hr=value,
+        _pace=value,
+        _distance=100.5,
+    )
+    data = step.to_dict()
+    assert set(data) == {f.name for f in fields(Step)}
+    assert data["intensity"] == "active"
+    assert data["steps"] == [{"duration": 30}]
+    assert data["_power"] == {"value": 1.0}
+
+
+def test_workout_doc_round_trip(json_backend):
+    """
+    Test that a WorkoutDoc survives a dict and JSON round trip unchanged.
+    """
+    doc = WorkoutDoc.from_dict(WORKOUT_DATA)
+    assert doc.to_dict() == WORKOUT_DATA
+    assert json.loads(doc.to_json()) == WORKOUT_DATA
+    assert WorkoutDoc.from_json(doc.to_json()) == doc
+
+
+def test_from_json_ignores_unknown_keys_and_null_values(json_backend):
+    """
+    Test that from_json skips keys that are not fields and accepts explicit nulls.
+    """
+    step = Step.from_json(
+        '{"duration": 60, "intensity": null, "unknown": 1, "power": {"units": "w"}}'
+    )
+    assert step == Step(duration=60, power=Value(units=ValueUnits.WATTS))
+
+
+def test_value_str_formats_units():
+    """
+    Test that Value.__str__ renders each unit with its suffix and label.
+    """
+    assert str(Value(value=95.0, units=ValueUnits.PERCENT_FTP)) == "95% ftp"
+    assert str(Value(value=2.0, units=ValueUnits.HR_ZONE, target=HrTarget.LAP)) == "Z2 HR hr=lap"
+    assert str(Value(value=250.0, units=ValueUnits.WATTS)) == "250W"
+    assert str(Value(value=90.5, units=ValueUnits.CADENCE)) == "90.5rpm Cadence"
+    assert str(Value(value=3.0)) == "3"
+
+
+def test_float_to_str():
+    """
+    Test that float_to_str drops the decimals of whole numbers only.
+    """
+    assert float_to_str(1500.0) == "1500"
+    assert float_to_str(1500.5) == "1500.5"
+    assert float_to_str(1234567.0) == "1234567"
+    assert float_to_str(1e16) == "10000000000000000"
+    assert float_to_str(-0.0) == "0"
+    assert float_to_str(1.2345678901234567) == "1.2345678901234567"
+
+
+def test_workout_doc_str():
+    """
+    Test that WorkoutDoc.__str__ renders the description, sections and repeated steps.
+    """
+    doc = WorkoutDoc.from_dict(WORKOUT_DATA)
+    assert str(doc) == (
+        "Threshold intervals\n"
+        "\nWarmup\n- 10m intensity=warmup 50.0 - 75.0 ftp \n\n"
+        "\n3x \n- 8m 100% ftp \n- 2m Z2 HR hr=10s \n\n"
+        "\nCooldown\n- 5m \n\n"
+    )
+
+
+def test_step_format_duration():
+    """
+    Test that step durations are split into hours, minutes and seconds.
+    """
+    assert Step(duration=45)._format_duration() == "45s"
+    assert Step(duration=90)._format_duration() == "1m30s"
+    assert Step(duration=3600)._format_duration() == "1h"
+    assert Step(duration=3630)._format_duration() == "1h0m30s"
+    assert Step(duration=3725)._format_duration() == "1h2m5s"
+    assert Step(duration=0)._format_duration() == "0s"
+
+
+def test_to_json_keeps_non_ascii_text(monkeypatch):
+    """
+    Test that the stdlib JSON backend writes non-ASCII workout text without escaping it.
+    """
+    monkeypatch.setattr(types, "_json_dumps", types._stdlib_json_dumps)
+    monkeypatch.setattr(types, "_json_loads", json.loads)
+    step = Step(text="Séance à 95 %", duration=60)
+    assert "Séance à 95 %" in step.to_json()
+    assert Step.from_json(step.to_json()) == step
+
+
+def test_workout_doc_dump_and_load_many(json_backend):
+    """
+    Test that a list of WorkoutDocs round trips through a single JSON array.
+    """
+    docs = [WorkoutDoc.from_dict(WORKOUT_DATA), WorkoutDoc(description="Rest day")]
+    dumped = WorkoutDoc.dump_many(docs)
+    assert json.loads(dumped) == [WORKOUT_DATA, {"description": "Rest day"}]
+    assert WorkoutDoc.load_many(dumped) == docs
+
+
+def test_from_dict_rejects_invalid_enum_values():
+    """
+    Test that unknown or unhashable enum values raise ValueError.
+    """
+    with pytest.raises(ValueError):
+        Step.from_dict({"intensity": "bogus"})
+    with pytest.raises(ValueError):
+        Step.from_dict({"intensity": ["a"]})
+
+
+def test_workout_types_use_slots():
+    """
+    Test that workout instances keep their fields in slots and assign them without overrides.
+    """
+    for cls in (Value, Step, WorkoutDoc):
+        instance = cls()
+        assert not hasattr(instance, "__dict__")
+        assert cls.__setattr__ is object.__setattr__
+
+
+def test_workout_doc_str_reflects_in_place_edits():
+    """
+    Test that WorkoutDoc.__str__ picks up changes made to nested steps.
+    """
+    doc = WorkoutDoc(description="Easy", steps=[Step(duration=600)])
+    assert str(doc) == "Easy\n- 10m \n"
+    assert doc.steps is not None
+    doc.steps[0].duration = 900
+    doc.steps.append(Step(duration=60))
+    assert str(doc) == "Easy\n- 15m \n- 1m \n"